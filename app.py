@@ -3,9 +3,20 @@
 New Flask application entry point using refactored architecture.
 """
 
-import sys
 import os
 
+# gevent must patch the standard library before socket/time/threading are imported,
+# so USE_GEVENT is read here rather than from the settings (see ServerConfig)
+monkey = None
+if (os.environ.get("USE_GEVENT") or "true").lower() in ("1", "true", "yes"):
+    try:
+        from gevent import monkey
+        monkey.patch_all()
+    except ImportError:
+        monkey = None
+
+import sys
+
 # Add src directory to Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
@@ -17,6 +28,13 @@ def main():
     app = create_app()
     settings = get_settings()
     
+    if settings.server.use_gevent and monkey is not None and not settings.server.debug:
+        from gevent.pywsgi import WSGIServer
+        
+        access_log = 'default' if settings.logging.access_log else None
+        WSGIServer((settings.server.host, settings.server.port), app, log=access_log).serve_forever()
+        return
+    
     app.run(
         host=settings.server.host,
         port=settings.server.port,
@@ -0,0 +1,75 @@
+"""Server-side micro-batching of concurrent search requests."""
+
+import logging
+from typing import Dict, List, Tuple
+
+try:
+    import gevent
+    from gevent import monkey
+    from gevent.event import AsyncResult
+    from gevent.queue import Queue, Empty
+except ImportError:
+    gevent = None
+
+from ..core.services import MovieSearchService
+from ..domain.models import SearchResponse
+
+
+def batching_available() -> bool:
+    """Check if requests run on cooperatively scheduled greenlets."""
+    return gevent is not None and monkey.is_module_patched("threading")
+
+
+class QueryBatcher:
+    """Coalesce concurrent queries into MovieSearchService.search_batch calls."""
+
+    def __init__(self, service: MovieSearchService, batch_size: int = 16):
+        if not batching_available():
+            raise RuntimeError("Query batching requires gevent monkey-patching")
+
+        self.service = service
+        self.batch_size = batch_size
+        self.logger = logging.getLogger(__name__)
+
+        self._queue = Queue()
+        self._dispatcher = gevent.spawn(self._dispatch_loop)
+
+    def search(self, query: str, limit: int) -> SearchResponse:
+        """Queue query and wait for its batch to complete."""
+        result = AsyncResult()
+        self._queue.put((result, query, limit))
+        return result.get()
+
+    def _dispatch_loop(self):
+        """Run up to batch_size queued queries together, without waiting for more."""
+        while True:
+            batch = [self._queue.get()]
+            # Let already runnable greenlets enqueue first; queries that arrive while a
+            # batch runs are picked up by the next one, so a lone query is never delayed
+            gevent.sleep(0)
+
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except Empty:
+                    break
+
+            self._run_batch(batch)
+
+    def _run_batch(self, batch: List[Tuple["AsyncResult", str, int]]):
+        """Run one search_batch call per distinct limit and deliver responses."""
+        by_limit: Dict[int, List[Tuple["AsyncResult", str, int]]] = {}
+        for item in batch:
+            by_limit.setdefault(item[2], []).append(item)
+
+        for limit, items in by_limit.items():
+            try:
+                responses = self.service.search_batch([query for _, query, _ in items], limit)
+            except Exception as e:
+                self.logger.error(f"Batched search failed: {e}")
+                for result, _, _ in items:
+                    result.set_exception(e)
+                continue
+
+            for (result, _, _), response in zip(items, responses):
+                result.set(response)
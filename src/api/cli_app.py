@@ -1,13 +1,37 @@
 """Command Line Interface application."""
 
+import io
+import os
 import sys
+import time
 import argparse
 import logging
-from typing import List
+import dataclasses
+from datetime import datetime
+from typing import Callable, List
+
+try:
+    from prompt_toolkit import PromptSession
+    from prompt_toolkit.auto_suggest import AutoSuggestFromHistory
+    from prompt_toolkit.completion import WordCompleter
+    from prompt_toolkit.history import FileHistory
+except ImportError:
+    PromptSession = None
 
 from ..config.settings import get_settings
 from ..core.services import MovieSearchService
-from ..domain.models import SearchResult
+from ..core.response_cache import MemoryCache
+from ..domain.models import SearchResult, SearchResponse
+
+
+_HEADER_RULE = "=" * 60 + "\n"
+_RESULT_RULE = "-" * 60 + "\n"
+
+_HISTORY_FILE = os.path.expanduser("~/.movie_search_history")
+_EXTRA_COMPLETIONS = [
+    'early', 'mid', 'late', '80s', '90s', '2000s', '2010s',
+    'directed', 'starring', 'with', 'from', 'about', 'movies', 'films'
+]
 
 
 class MovieSearchCLI:
@@ -16,6 +40,25 @@ class MovieSearchCLI:
     def __init__(self):
         self.settings = get_settings()
         self.search_service = MovieSearchService(self.settings)
+        self._response_cache = MemoryCache(self.settings.search.result_cache_size)
+    
+    def _search(self, query: str, limit: int = 10) -> SearchResponse:
+        """Search through the response cache; repeated queries skip the pipeline."""
+        start_time = time.perf_counter()
+        key = (' '.join(query.split()), limit)
+        
+        response = self._response_cache.get(key)
+        if response is not None:
+            # Report this lookup's time, not that of the original search
+            return dataclasses.replace(
+                response, execution_time_ms=(time.perf_counter() - start_time) * 1000
+            )
+        
+        response = self.search_service.search(*key)
+        # Empty responses may come from a transient failure; don't cache them
+        if response.results:
+            self._response_cache.put(key, response)
+        return response
     
     def initialize(self) -> bool:
         """Initialize the CLI application."""
@@ -41,7 +84,7 @@ class MovieSearchCLI:
                 return []
         
         try:
-            response = self.search_service.search(query, limit=limit)
+            response = self._search(query, limit)
             return response.results
         except Exception as e:
             print(f"❌ Search failed: {e}")
@@ -53,33 +96,38 @@ class MovieSearchCLI:
             print("No movies found matching your query.")
             return
         
-        print(f"\n🎬 Search Results for: '{query}'")
+        # Assemble the whole listing and write it at once instead of print() per line
+        buf = io.StringIO()
+        buf.write(f"\n🎬 Search Results for: '{query}'\n")
         if execution_time > 0:
-            print(f"⏱️  Search completed in {execution_time:.2f}ms")
-        print("=" * 60)
+            buf.write(f"⏱️  Search completed in {execution_time:.2f}ms\n")
+        buf.write(_HEADER_RULE)
         
         for i, search_result in enumerate(results, 1):
             movie = search_result.movie
-            print(f"\n{i}. {movie.title}")
+            buf.write(f"\n{i}. {movie.title}\n")
             
             if movie.year:
-                print(f"   📅 Year: {movie.year}")
+                buf.write(f"   📅 Year: {movie.year}\n")
             
             if movie.genres:
-                print(f"   🎭 Genres: {', '.join(movie.genres)}")
+                buf.write(f"   🎭 Genres: {', '.join(movie.genres)}\n")
             
             if movie.directors:
-                print(f"   🎬 Director(s): {', '.join(movie.directors)}")
+                buf.write(f"   🎬 Director(s): {', '.join(movie.directors)}\n")
             
             if movie.actors:
-                print(f"   🎭 Cast: {', '.join(movie.actors[:5])}")  # Show top 5
+                buf.write(f"   🎭 Cast: {', '.join(movie.actors[:5])}\n")  # Show top 5
             
             if movie.overview:
                 overview = movie.overview[:200] + '...' if len(movie.overview) > 200 else movie.overview
-                print(f"   📝 Overview: {overview}")
+                buf.write(f"   📝 Overview: {overview}\n")
             
-            print(f"   ⭐ Relevance: {search_result.relevance_score}%")
-            print("-" * 60)
+            buf.write(f"   ⭐ Relevance: {search_result.relevance_score}%\n")
+            buf.write(_RESULT_RULE)
+        
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
     
     def interactive_mode(self):
         """Run interactive search mode."""
@@ -91,9 +139,11 @@ class MovieSearchCLI:
             print("Failed to initialize search engine. Exiting.")
             return
         
+        read_query = self._make_prompt()
+        
         while True:
             try:
-                query = input("\n🔍 Enter your movie search query: ").strip()
+                query = read_query("\n🔍 Enter your movie search query: ").strip()
                 
                 if query.lower() in ['quit', 'exit', 'q']:
                     print("Goodbye! 👋")
@@ -108,15 +158,32 @@ class MovieSearchCLI:
                     continue
                 
                 print("Searching...")
-                response = self.search_service.search(query)
+                response = self._search(query)
                 self.display_results(response.results, query, response.execution_time_ms)
                 
-            except KeyboardInterrupt:
+            except (KeyboardInterrupt, EOFError):
                 print("\n\nGoodbye! 👋")
                 break
             except Exception as e:
                 print(f"An error occurred: {e}")
     
+    def _make_prompt(self) -> Callable[[str], str]:
+        """Build the interactive query reader.
+        
+        Uses prompt_toolkit (persistent history, suggestions, genre completion)
+        when installed and attached to a terminal, plain input() otherwise.
+        """
+        if PromptSession is None or not sys.stdin.isatty():
+            return input
+        
+        words = list(self.search_service.query_parser.genre_synonyms) + _EXTRA_COMPLETIONS
+        session = PromptSession(
+            history=FileHistory(_HISTORY_FILE),
+            auto_suggest=AutoSuggestFromHistory(),
+            completer=WordCompleter(words, ignore_case=True)
+        )
+        return session.prompt
+    
     def show_help(self):
         """Show help information."""
         help_text = """
@@ -148,11 +215,36 @@ Commands:
         if not self.initialize():
             sys.exit(1)
         
-        response = self.search_service.search(query, limit=limit)
+        response = self._search(query, limit)
         self.display_results(response.results, query, response.execution_time_ms)
     
     def show_status(self):
-        """Show system status."""
+        """Show dataset and index status without loading the search engine."""
+        db_config = self.settings.database
+        
+        if os.path.exists(db_config.movies_path):
+            stat = os.stat(db_config.movies_path)
+            modified = datetime.fromtimestamp(stat.st_mtime).strftime("%Y-%m-%d %H:%M")
+            print(f"✅ Dataset: {db_config.movies_path} "
+                  f"({stat.st_size / (1024*1024):.2f} MB, modified {modified})")
+        else:
+            print(f"❌ Dataset not found: {db_config.movies_path}")
+        
+        # index_dir also holds the web app's response cache, so look for each index
+        indices = [
+            ("Whoosh", self.search_service.whoosh_engine),
+            ("TF-IDF", self.search_service.tfidf_engine),
+        ]
+        for name, engine in indices:
+            if engine.has_saved_index():
+                print(f"✅ {name} index: {db_config.index_dir}")
+            else:
+                print(f"⚠️  {name} index not built yet: {db_config.index_dir}")
+        
+        print(f"🔧 Environment: {self.settings.environment}")
+    
+    def show_deep_status(self):
+        """Show system status after fully initializing the search service."""
         if not self.initialize():
             print("❌ Search service not available")
             return
@@ -168,10 +260,14 @@ def main():
     parser.add_argument('query', nargs='*', help='Search query')
     parser.add_argument('-l', '--limit', type=int, default=10, help='Maximum number of results')
     parser.add_argument('-i', '--interactive', action='store_true', help='Run in interactive mode')
-    parser.add_argument('--status', action='store_true', help='Show system status')
+    parser.add_argument('--status', action='store_true', help='Show dataset and index status')
+    parser.add_argument('--deep-status', action='store_true',
+                        help='Load the search engine and show full system status')
     parser.add_argument('-v', '--verbose', action='store_true', help='Verbose output')
     
     args = parser.parse_args()
+    if args.limit < 1:
+        parser.error("--limit must be at least 1")
     
     cli = MovieSearchCLI()
     
@@ -179,15 +275,18 @@ def main():
         # Override logging level for verbose mode
         logging.getLogger().setLevel(logging.DEBUG)
     
-    if args.status:
-        cli.show_status()
-        return
-    
-    if args.interactive or not args.query:
-        cli.interactive_mode()
-    else:
-        query = ' '.join(args.query)
-        cli.run_single_search(query, args.limit)
+    try:
+        if args.status:
+            cli.show_status()
+        elif args.deep_status:
+            cli.show_deep_status()
+        elif args.interactive or not args.query:
+            cli.interactive_mode()
+        else:
+            query = ' '.join(args.query)
+            cli.run_single_search(query, args.limit)
+    finally:
+        cli.search_service.close()
 
 
 if __name__ == "__main__":
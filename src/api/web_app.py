@@ -1,10 +1,69 @@
 """Flask web application."""
 
+import hmac
+import time
 import logging
-from flask import Flask, render_template, request, jsonify
+from collections import namedtuple
+from typing import Any, Dict, List
+
+from flask import Flask, Response, g, render_template, request, jsonify
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from ..config.settings import get_settings
 from ..core.services import MovieSearchService
+from ..core.response_cache import MemoryCache, ResponseCache
+from ..domain.models import SearchResponse
+from .batcher import QueryBatcher, batching_available
+
+logger = logging.getLogger(__name__)
+
+# Row rendered by results.html
+ResultRow = namedtuple(
+    'ResultRow',
+    ['title', 'year', 'genres', 'overview', 'cast', 'directors', 'relevance_score']
+)
+
+
+def ojsonify(obj: Any, status: int = 200) -> Response:
+    """Serialize obj to a JSON response, using orjson when it is installed."""
+    if orjson is None:
+        response = jsonify(obj)
+        response.status_code = status
+        return response
+    return Response(
+        orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY),
+        status=status,
+        mimetype='application/json'
+    )
+
+
+def _normalize_query(query: str) -> str:
+    """Collapse whitespace so equivalent queries share a cache entry.
+    
+    Case is preserved because person-name detection relies on capitalization.
+    """
+    return ' '.join(query.split())
+
+
+def _template_results(results: List[Dict[str, Any]]) -> List[ResultRow]:
+    """Convert serialized search results to the rows used by results.html."""
+    return [
+        ResultRow(
+            title=result['title'],
+            year=result['year'],
+            genres=result['genres'],
+            overview=(result['overview'][:300] + '...'
+                      if len(result['overview']) > 300 else result['overview']),
+            cast=result['actors'][:5],  # Show top 5 actors
+            directors=result['directors'],
+            relevance_score=result['relevance_score']
+        )
+        for result in results
+    ]
 
 
 def create_app() -> Flask:
@@ -25,19 +84,69 @@ def create_app() -> Flask:
         format=settings.logging.format
     )
     
+    if settings.logging.access_log:
+        @app.before_request
+        def start_timer():
+            g.request_start = time.perf_counter()
+        
+        @app.after_request
+        def log_request(response):
+            logger.info(
+                "%s %s %s %.1fms",
+                request.method, request.full_path, response.status_code,
+                (time.perf_counter() - g.request_start) * 1000
+            )
+            return response
+    
     # Initialize search service (lazy loading)
     search_service = None
+    batcher = None
+    response_cache = ResponseCache(
+        settings.database,
+        settings.search.response_cache_ttl,
+        settings.search.response_cache_max_entries
+    )
+    memory_cache = MemoryCache(settings.search.result_cache_size)
     
     def get_search_service() -> MovieSearchService:
         """Get search service instance (lazy initialization)."""
-        nonlocal search_service
+        nonlocal search_service, batcher
         if search_service is None:
             search_service = MovieSearchService(settings)
             if not search_service.initialize():
-                logging.error("Failed to initialize search service")
+                logger.error("Failed to initialize search service")
                 return None
+            # Persisted responses may predate a dataset or settings change
+            response_cache.bind(search_service.get_fingerprint())
+            if batching_available():
+                batcher = QueryBatcher(search_service, batch_size=settings.server.batch_size)
         return search_service
     
+    def run_search(query: str, limit: int) -> SearchResponse:
+        """Search directly, or through the batcher when running under gevent."""
+        if batcher is not None:
+            return batcher.search(query, limit)
+        return get_search_service().search(query, limit=limit)
+    
+    def cached_search(query: str, limit: int) -> Dict[str, Any]:
+        """Run a search, reusing a memoized or persisted serialized response."""
+        start_time = time.perf_counter()
+        key = (query, limit)
+        response = memory_cache.get(key)
+        if response is None:
+            response = response_cache.get(query, limit)
+            if response is None:
+                response = run_search(query, limit).to_dict()
+                # Empty responses may come from a transient failure; don't cache them
+                if response['results']:
+                    response_cache.put(query, limit, response)
+                    memory_cache.put(key, response)
+                return response
+            memory_cache.put(key, response)
+        
+        # Report this lookup's time, not that of the original search
+        return {**response, 'execution_time_ms': (time.perf_counter() - start_time) * 1000}
+    
     @app.route('/')
     def index():
         """Home page."""
@@ -61,32 +170,18 @@ def create_app() -> Flask:
             )
         
         try:
-            response = service.search(query, limit=20)
-            
-            # Convert SearchResult objects to dictionaries for template
-            results = []
-            for search_result in response.results:
-                movie = search_result.movie
-                results.append({
-                    'title': movie.title,
-                    'year': movie.year,
-                    'genres': movie.genres,
-                    'overview': movie.overview[:300] + '...' if len(movie.overview) > 300 else movie.overview,
-                    'cast': movie.actors[:5],  # Show top 5 actors
-                    'directors': movie.directors,
-                    'relevance_score': search_result.relevance_score
-                })
+            response = cached_search(_normalize_query(query), 20)
             
             return render_template(
                 'results.html', 
                 query=query, 
-                results=results,
-                total_found=response.total_found,
-                execution_time=response.execution_time_ms
+                results=_template_results(response['results']),
+                total_found=response['total_found'],
+                execution_time=response['execution_time_ms']
             )
             
         except Exception as e:
-            logging.error(f"Search error: {e}")
+            logger.error("Search error for %r: %s", query, e)
             return render_template('index.html', error=f"Search failed: {str(e)}")
     
     @app.route('/api/search')
@@ -94,40 +189,52 @@ def create_app() -> Flask:
         """API search endpoint."""
         query = request.args.get('q', '').strip()
         if not query:
-            return jsonify({'error': 'Query parameter q is required'}), 400
+            return ojsonify({'error': 'Query parameter q is required'}, 400)
         
         service = get_search_service()
         if not service:
-            return jsonify({'error': 'Search service not available'}), 503
+            return ojsonify({'error': 'Search service not available'}, 503)
         
         try:
             limit = int(request.args.get('limit', 10))
-            response = service.search(query, limit=limit)
-            
-            return jsonify(response.to_dict())
+            if limit < 1:
+                raise ValueError(f"limit must be positive, got {limit}")
+            return ojsonify(cached_search(_normalize_query(query), limit))
             
         except ValueError:
-            return jsonify({'error': 'Invalid limit parameter'}), 400
+            return ojsonify({'error': 'Invalid limit parameter'}, 400)
         except Exception as e:
-            logging.error(f"API search error: {e}")
-            return jsonify({'error': str(e)}), 500
+            logger.error("API search error for %r: %s", query, e)
+            return ojsonify({'error': str(e)}, 500)
     
     @app.route('/api/status')
     def api_status():
         """API status endpoint."""
         service = get_search_service()
         if service and service.is_ready():
-            return jsonify({
+            return ojsonify({
                 'status': 'ready',
                 'movie_count': service.get_movie_count(),
                 'version': '2.0.0'
             })
         else:
-            return jsonify({
+            return ojsonify({
                 'status': 'not_ready',
                 'message': 'Search service not initialized'
             })
     
+    @app.route('/api/admin/flush', methods=['POST'])
+    def api_flush():
+        """Drop all memoized search responses."""
+        admin_token = settings.server.admin_token
+        supplied = request.headers.get('X-Admin-Token', '')
+        if not admin_token or not hmac.compare_digest(supplied, admin_token):
+            return ojsonify({'error': 'Forbidden'}, 403)
+        
+        memory_cache.clear()
+        response_cache.invalidate()
+        return ojsonify({'status': 'flushed'})
+    
     @app.route('/status')
     def status():
         """Legacy status endpoint for compatibility."""
@@ -136,12 +243,12 @@ def create_app() -> Flask:
     @app.errorhandler(404)
     def not_found(error):
         """Handle 404 errors."""
-        return jsonify({'error': 'Not found'}), 404
+        return ojsonify({'error': 'Not found'}, 404)
     
     @app.errorhandler(500)
     def internal_error(error):
         """Handle 500 errors."""
-        logging.error(f"Internal server error: {error}")
-        return jsonify({'error': 'Internal server error'}), 500
+        logger.error("Internal server error: %s", error)
+        return ojsonify({'error': 'Internal server error'}, 500)
     
     return app
@@ -6,26 +6,59 @@ from dataclasses import dataclass, field
 from functools import lru_cache
 
 
-@dataclass
+@dataclass(frozen=True)
 class DatabaseConfig:
     """Database configuration."""
     data_dir: str = "data"
     movies_file: str = "movies_metadata.csv"
+    movies_cache_file: str = "movies_metadata.pkl"
     index_dir: str = "index"
+    response_cache_file: str = "responses.sqlite"
+    tfidf_vectorizer_file: str = "tfidf_vectorizer.joblib"
+    tfidf_matrix_dir: str = "tfidf_matrix"
+    whoosh_fingerprint_file: str = "whoosh_fingerprint.txt"
     
     @property
     def movies_path(self) -> str:
         """Get full path to movies file."""
         return os.path.join(self.data_dir, self.movies_file)
+    
+    @property
+    def movies_cache_path(self) -> str:
+        """Get full path to parsed movies cache."""
+        return os.path.join(self.data_dir, self.movies_cache_file)
+    
+    @property
+    def response_cache_path(self) -> str:
+        """Get full path to persistent response cache."""
+        return os.path.join(self.index_dir, self.response_cache_file)
+    
+    @property
+    def tfidf_vectorizer_path(self) -> str:
+        """Get full path to fitted TF-IDF vectorizer."""
+        return os.path.join(self.index_dir, self.tfidf_vectorizer_file)
+    
+    @property
+    def tfidf_matrix_path(self) -> str:
+        """Get full path to TF-IDF document matrix arrays."""
+        return os.path.join(self.index_dir, self.tfidf_matrix_dir)
+    
+    @property
+    def whoosh_fingerprint_path(self) -> str:
+        """Get full path to the dataset fingerprint the Whoosh index was built from."""
+        return os.path.join(self.index_dir, self.whoosh_fingerprint_file)
 
 
-@dataclass
+@dataclass(frozen=True)
 class SearchConfig:
     """Search engine configuration."""
     tfidf_max_features: int = 5000
     tfidf_ngram_range: tuple = (1, 2)
     tfidf_min_df: int = 2
-    whoosh_limit_multiplier: int = 2
+    # Hash tokens to columns instead of keeping a vocabulary; max_features and
+    # min_df do not apply, and n_features sets the column count
+    tfidf_use_hashing: bool = False
+    tfidf_hashing_features: int = 2 ** 20
     tfidf_limit_multiplier: int = 3
     whoosh_weight: float = 0.6
     tfidf_weight: float = 0.4
@@ -34,37 +67,72 @@ class SearchConfig:
     genre_boost: float = 0.3
     actor_boost: float = 0.4
     year_boost: float = 0.2
+    
+    # Number of (query, limit) responses memoized by the web and CLI front-ends
+    result_cache_size: int = 1024
+    # Number of query vectors / result lists memoized by each search engine
+    engine_cache_size: int = 512
+    # Seconds a persisted response stays valid (0 keeps entries until flushed)
+    response_cache_ttl: int = 3600
+    # Most persisted responses kept; the oldest are dropped beyond this (0 = no cap)
+    response_cache_max_entries: int = 10000
+    
+    # Whoosh index writer: posting buffer per process (MB), and indexing processes
+    # (0 uses all but one CPU); extra processes are fed documents in batches of
+    # whoosh_writer_batchsize and their segments are merged at commit
+    whoosh_writer_limitmb: int = 256
+    whoosh_writer_procs: int = 1
+    whoosh_writer_batchsize: int = 1000
 
 
-@dataclass
+@dataclass(frozen=True)
 class ServerConfig:
     """Server configuration."""
     host: str = "0.0.0.0"
     port: int = 5000
     debug: bool = False
-    secret_key: str = field(default_factory=lambda: os.urandom(24).hex())
+    secret_key: str = ""
+    # Serve with gevent's WSGI server when gevent is installed
+    use_gevent: bool = True
+    # Most concurrent /api/search requests run as one batch (gevent only)
+    batch_size: int = 16
+    # Token required by /api/admin/* in the X-Admin-Token header; empty disables them
+    admin_token: str = ""
     
     def __post_init__(self):
-        """Set secret key from environment if available."""
-        env_secret = os.environ.get("SESSION_SECRET")
-        if env_secret:
-            self.secret_key = env_secret
+        """Set secret key and server options from environment if available."""
+        if not self.secret_key:
+            secret = os.environ.get("SESSION_SECRET") or os.urandom(24).hex()
+            object.__setattr__(self, "secret_key", secret)
+        
+        env_gevent = os.environ.get("USE_GEVENT")
+        if env_gevent:
+            object.__setattr__(self, "use_gevent", env_gevent.lower() in ("1", "true", "yes"))
+        
+        if not self.admin_token:
+            object.__setattr__(self, "admin_token", os.environ.get("ADMIN_TOKEN", ""))
 
 
-@dataclass
+@dataclass(frozen=True)
 class LoggingConfig:
     """Logging configuration."""
     level: str = "INFO"
     format: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    # Log one line per HTTP request (method, path, status, duration)
+    access_log: bool = False
     
     def __post_init__(self):
-        """Set logging level from environment if available."""
+        """Set logging options from environment if available."""
         env_level = os.environ.get("LOG_LEVEL")
         if env_level:
-            self.level = env_level.upper()
+            object.__setattr__(self, "level", env_level.upper())
+        
+        env_access_log = os.environ.get("ACCESS_LOG")
+        if env_access_log:
+            object.__setattr__(self, "access_log", env_access_log.lower() in ("1", "true", "yes"))
 
 
-@dataclass
+@dataclass(frozen=True)
 class Settings:
     """Application settings."""
     database: DatabaseConfig = field(default_factory=DatabaseConfig)
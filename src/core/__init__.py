@@ -2,5 +2,6 @@
 
 from .services import MovieSearchService
 from .query_parser import QueryParser
+from .response_cache import MemoryCache, ResponseCache
 
-__all__ = ["MovieSearchService", "QueryParser"]
+__all__ = ["MovieSearchService", "QueryParser", "MemoryCache", "ResponseCache"]
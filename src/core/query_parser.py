@@ -2,22 +2,42 @@
 
 import re
 import logging
+import threading
+from functools import lru_cache
 from typing import Dict, Any, Optional, List, Tuple
 
-try:
-    import spacy
-    from spacy.lang.en import English
-except ImportError:
-    spacy = None
-
 from ..domain.models import SearchQuery
 
 
+# Year parsing patterns, tried in order, with the QueryParser method handling each match
+_YEAR_PATTERNS = [
+    (re.compile(r"(\d{4})s"), "_parse_decade"),  # "90s", "2000s"
+    (re.compile(r"early (\d{4})s"), "_parse_early_decade"),  # "early 2000s"
+    (re.compile(r"late (\d{4})s"), "_parse_late_decade"),  # "late 90s"
+    (re.compile(r"mid (\d{4})s"), "_parse_mid_decade"),  # "mid 90s"
+    (re.compile(r"(\d{4})"), "_parse_single_year"),  # "1995"
+]
+
+_WORD_RE = re.compile(r'\w+')
+
+# Only NER output is consumed; skip loading the rest of en_core_web_sm.
+# tok2vec stays in case the model's NER listens to it.
+_UNUSED_SPACY_PIPES = ["tagger", "parser", "attribute_ruler", "lemmatizer"]
+
+# Words near a person name that mark them as a director
+_DIRECTOR_KEYWORDS = frozenset({'directed', 'director', 'by'})
+
+# Cheap probe for a possible person name; spaCy runs only when it matches
+_CAPITALIZED_WORD_RE = re.compile(r"\b[A-Z]")
+
+
 class QueryParser:
     """Parse natural language queries into structured search parameters."""
     
     def __init__(self):
-        self.nlp = None
+        self._nlp = None
+        self._nlp_loaded = False
+        self._nlp_lock = threading.Lock()
         self.logger = logging.getLogger(__name__)
         
         # Genre synonyms mapping
@@ -48,70 +68,94 @@ class QueryParser:
             'music': 'music'
         }
         
-        # Year parsing patterns
+        # Single-pass scanner over all synonyms, longest first so "musical" wins over "music".
+        # Matches must start a word so "war" isn't found inside "toward" or "award".
+        self._genre_pattern = re.compile(r'(?<!\w)(?:' + '|'.join(
+            re.escape(synonym)
+            for synonym in sorted(self.genre_synonyms, key=len, reverse=True)
+        ) + ')')
+        
+        # Year parsing patterns bound to their handlers
         self.year_patterns = [
-            (r"(\d{4})s", self._parse_decade),  # "90s", "2000s"
-            (r"early (\d{4})s", self._parse_early_decade),  # "early 2000s"
-            (r"late (\d{4})s", self._parse_late_decade),  # "late 90s"
-            (r"mid (\d{4})s", self._parse_mid_decade),  # "mid 90s"
-            (r"(\d{4})", self._parse_single_year),  # "1995"
+            (pattern, getattr(self, handler)) for pattern, handler in _YEAR_PATTERNS
         ]
         
         # Stop words for keyword extraction
-        self.stop_words = {
+        self.stop_words = frozenset({
             'with', 'from', 'in', 'the', 'and', 'or', 'by', 'about', 
             'movies', 'films', 'film', 'movie', 'starring', 'directed',
             'a', 'an', 'is', 'are', 'was', 'were', 'be', 'been', 'being'
-        }
+        })
         
-        self._init_nlp()
+        # spaCy NER dominates parse() cost; memoize it per query string
+        self._cached_persons = lru_cache(maxsize=2048)(self._find_persons)
+    
+    @property
+    def nlp(self):
+        """spaCy NLP model, loaded on first access (None if unavailable)."""
+        if not self._nlp_loaded:
+            with self._nlp_lock:
+                if not self._nlp_loaded:
+                    self._nlp = self._load_nlp()
+                    self._nlp_loaded = True
+        return self._nlp
     
-    def _init_nlp(self):
-        """Initialize spaCy NLP model."""
-        if spacy is None:
+    @nlp.setter
+    def nlp(self, value):
+        self._nlp = value
+        self._nlp_loaded = True
+    
+    def _load_nlp(self):
+        """Import spaCy and load the English model."""
+        try:
+            import spacy
+        except ImportError:
             self.logger.warning("spaCy not available. Using basic text processing.")
-            return
+            return None
         
         try:
-            self.nlp = spacy.load("en_core_web_sm")
+            nlp = spacy.load("en_core_web_sm", exclude=_UNUSED_SPACY_PIPES)
             self.logger.info("spaCy English model loaded successfully")
+            return nlp
         except OSError:
             self.logger.warning("spaCy English model not found. Using basic text processing.")
-            self.nlp = None
+            return None
     
     def parse(self, query: str) -> SearchQuery:
         """Parse natural language query into SearchQuery object."""
-        query_info = SearchQuery(
-            original_query=query,
-            processed_query=query.lower(),
-            genres=[],
-            actors=[],
-            directors=[],
-            keywords=[]
-        )
+        query_lower = query.lower()
         
         # Extract year ranges
-        query_info.year_range = self._extract_year_range(query)
+        year_range = self._extract_year_range(query_lower)
         
         # Extract genres using synonyms
-        query_info.genres = self._extract_genres(query)
+        genres = self._extract_genres(query_lower)
         
-        # Extract person names using spaCy if available
-        if self.nlp:
+        # Extract person names using spaCy if available and a name may be present
+        actors, directors = [], []
+        if _CAPITALIZED_WORD_RE.search(query) and self.nlp:
             actors, directors = self._extract_persons_with_spacy(query)
-            query_info.actors.extend(actors)
-            query_info.directors.extend(directors)
         
         # Extract keywords (remove common words and detected entities)
-        query_info.keywords = self._extract_keywords(query, query_info)
+        keywords = self._extract_keywords(query_lower, genres + actors + directors)
+        
+        query_info = SearchQuery(
+            original_query=query,
+            processed_query=query_lower,
+            genres=genres,
+            actors=actors,
+            directors=directors,
+            keywords=keywords,
+            year_range=year_range
+        )
         
-        self.logger.debug(f"Parsed query: {query_info}")
+        self.logger.debug("Parsed query: %s", query_info)
         return query_info
     
-    def _extract_year_range(self, query: str) -> Optional[Tuple[int, int]]:
-        """Extract year range from query."""
+    def _extract_year_range(self, query_lower: str) -> Optional[Tuple[int, int]]:
+        """Extract year range from lowercased query."""
         for pattern, extractor in self.year_patterns:
-            match = re.search(pattern, query)
+            match = pattern.search(query_lower)
             if match:
                 return extractor(match)
         return None
@@ -152,22 +196,35 @@ class QueryParser:
         year = int(match.group(1))
         return (year, year)
     
-    def _extract_genres(self, query: str) -> List[str]:
-        """Extract genres from query using synonyms."""
+    def _extract_genres(self, query_lower: str) -> List[str]:
+        """Extract genres from lowercased query using synonyms."""
         genres = []
-        query_lower = query.lower()
+        seen = set()
         
-        for synonym, genre in self.genre_synonyms.items():
-            if synonym in query_lower:
-                if genre not in genres:
-                    genres.append(genre)
+        for match in self._genre_pattern.finditer(query_lower):
+            genre = self.genre_synonyms[match.group()]
+            if genre not in seen:
+                seen.add(genre)
+                genres.append(genre)
         
         return genres
     
     def _extract_persons_with_spacy(self, query: str) -> Tuple[List[str], List[str]]:
         """Extract person names using spaCy NER."""
+        actors, directors = self._cached_persons(query)
+        return list(actors), list(directors)
+    
+    def _find_persons(self, query: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        """Run spaCy NER and split PERSON entities into actors and directors."""
         actors = []
         directors = []
+        query_lower = query.lower()
+        
+        # Tokenize once for all entities; map each word to its first position
+        query_words = query_lower.split()
+        word_positions = {}
+        for i, word in enumerate(query_words):
+            word_positions.setdefault(word, i)
         
         doc = self.nlp(query)
         
@@ -175,20 +232,34 @@ class QueryParser:
             if ent.label_ == "PERSON":
                 person_name = ent.text.strip()
                 # Simple heuristic: if "directed" appears near the name, it's likely a director
-                if self._is_likely_director(query, person_name):
+                if self._is_likely_director(query_lower, query_words, word_positions, person_name):
                     directors.append(person_name)
                 else:
                     actors.append(person_name)
         
-        return actors, directors
+        return tuple(actors), tuple(directors)
     
-    def _is_likely_director(self, query: str, person_name: str) -> bool:
-        """Check if person is likely a director based on context."""
-        director_keywords = ['directed', 'director', 'by']
-        query_lower = query.lower()
-        person_lower = person_name.lower()
+    def _is_likely_director(
+        self,
+        query_lower: str,
+        query_words: List[str],
+        word_positions: Dict[str, int],
+        person_name: str
+    ) -> bool:
+        """Check if person is likely a director based on context in lowercased query."""
+        person_words = person_name.lower().split()
+        if not person_words:
+            return False
+        
+        # Fast path: name aligned with query words, context is 3 words either side
+        start = word_positions.get(person_words[0])
+        end = start + len(person_words) if start is not None else None
+        if start is not None and query_words[start:end] == person_words:
+            context_words = query_words[max(0, start - 3):start] + query_words[end:end + 3]
+            return not _DIRECTOR_KEYWORDS.isdisjoint(context_words)
         
-        # Find position of person name in query
+        # Name not aligned with whitespace (e.g. "Spielberg's"): search by characters
+        person_lower = ' '.join(person_words)
         person_pos = query_lower.find(person_lower)
         if person_pos == -1:
             return False
@@ -197,32 +268,21 @@ class QueryParser:
         words_before = query_lower[:person_pos].split()[-3:]  # 3 words before
         words_after = query_lower[person_pos + len(person_lower):].split()[:3]  # 3 words after
         
-        context_words = words_before + words_after
-        
-        return any(keyword in context_words for keyword in director_keywords)
+        return not _DIRECTOR_KEYWORDS.isdisjoint(words_before + words_after)
     
-    def _extract_keywords(self, query: str, query_info: SearchQuery) -> List[str]:
-        """Extract keywords from query, excluding stop words and detected entities."""
-        words = query.lower().split()
-        keywords = []
+    def _extract_keywords(self, query_lower: str, entities: List[str]) -> List[str]:
+        """Extract keywords from lowercased query, excluding stop words and detected entities."""
+        # Remove words of detected entities and matched genre synonyms ("sci-fi") from consideration
+        entity_words = set()
+        for entity in entities:
+            entity_words.update(_WORD_RE.findall(entity.lower()))
+        for match in self._genre_pattern.finditer(query_lower):
+            entity_words.update(_WORD_RE.findall(match.group()))
         
-        # Remove detected entities from consideration
-        detected_entities = (
-            query_info.genres + 
-            query_info.actors + 
-            query_info.directors
-        )
-        detected_entities_lower = [entity.lower() for entity in detected_entities]
-        
-        for word in words:
-            # Clean word of punctuation
-            clean_word = re.sub(r'[^\w]', '', word)
-            
-            if (clean_word and 
-                clean_word not in self.stop_words and
-                len(clean_word) > 2 and
-                not clean_word.isdigit() and
-                not any(clean_word in entity for entity in detected_entities_lower)):
-                keywords.append(clean_word)
-        
-        return keywords
+        return [
+            word for word in _WORD_RE.findall(query_lower)
+            if len(word) > 2 and
+            not word.isdigit() and
+            word not in self.stop_words and
+            word not in entity_words
+        ]
@@ -0,0 +1,157 @@
+"""Caches for search responses."""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+from ..config.settings import DatabaseConfig
+
+
+class MemoryCache:
+    """Thread-safe in-process LRU map, e.g. of (query, limit) to a response.
+    
+    Unlike functools.lru_cache, callers decide what gets stored, so responses
+    from failed searches can be left out.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value, marking it recently used, or None on miss."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Cache value, evicting the least recently used entry when full."""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+class ResponseCache:
+    """SQLite-backed key-value store of search responses shared across processes."""
+
+    def __init__(self, config: DatabaseConfig, ttl_seconds: int = 0, max_entries: int = 0):
+        self.config = config
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(__name__)
+
+    @staticmethod
+    def make_key(query: str, limit: int) -> str:
+        """Build cache key from query and result limit."""
+        return f"{' '.join(query.split())}|{limit}"
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use."""
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.config.response_cache_path) or '.', exist_ok=True)
+            conn = sqlite3.connect(self.config.response_cache_path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS resp (key TEXT PRIMARY KEY, payload BLOB, ts INTEGER)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS resp_ts ON resp (ts)")
+            conn.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT)")
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def get(self, query: str, limit: int) -> Optional[Dict[str, Any]]:
+        """Return cached response, or None on miss or expiry."""
+        try:
+            with self._lock:
+                row = self._connect().execute(
+                    "SELECT payload, ts FROM resp WHERE key = ?", (self.make_key(query, limit),)
+                ).fetchone()
+        except sqlite3.Error as e:
+            self.logger.warning(f"Response cache read failed: {e}")
+            return None
+
+        if row is None:
+            return None
+
+        payload, ts = row
+        if self.ttl_seconds and time.time() - ts > self.ttl_seconds:
+            return None
+        return json.loads(payload)
+
+    def put(self, query: str, limit: int, response: Dict[str, Any]) -> None:
+        """Store serialized response, dropping expired and surplus entries."""
+        try:
+            payload = json.dumps(response)
+            now = int(time.time())
+            with self._lock:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO resp (key, payload, ts) VALUES (?, ?, ?)",
+                    (self.make_key(query, limit), payload, now)
+                )
+                if self.ttl_seconds:
+                    conn.execute("DELETE FROM resp WHERE ts < ?", (now - self.ttl_seconds,))
+                if self.max_entries:
+                    conn.execute(
+                        "DELETE FROM resp WHERE key IN "
+                        "(SELECT key FROM resp ORDER BY ts DESC LIMIT -1 OFFSET ?)",
+                        (self.max_entries,)
+                    )
+                conn.commit()
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            self.logger.warning(f"Response cache write failed: {e}")
+
+    def bind(self, fingerprint: str) -> None:
+        """Drop cached responses unless they came from the fingerprinted data and settings."""
+        try:
+            with self._lock:
+                conn = self._connect()
+                row = conn.execute("SELECT value FROM meta WHERE name = 'fingerprint'").fetchone()
+                if row is not None and row[0] == fingerprint:
+                    return
+                conn.execute("DELETE FROM resp")
+                conn.execute(
+                    "INSERT OR REPLACE INTO meta (name, value) VALUES ('fingerprint', ?)",
+                    (fingerprint,)
+                )
+                conn.commit()
+            if row is not None:
+                self.logger.info("Response cache is stale; cleared it")
+        except sqlite3.Error as e:
+            self.logger.warning(f"Response cache fingerprint check failed: {e}")
+
+    def invalidate(self) -> None:
+        """Remove all cached responses."""
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute("DELETE FROM resp")
+                conn.commit()
+        except sqlite3.Error as e:
+            self.logger.warning(f"Response cache invalidation failed: {e}")
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
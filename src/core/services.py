@@ -1,12 +1,16 @@
 """Core business logic services."""
 
+import os
 import time
+import heapq
 import logging
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from typing import List, Dict, Any, Optional, Tuple
 
 from ..domain.models import Movie, SearchQuery, SearchResult, SearchResponse
 from ..infrastructure.repositories import MovieRepository
-from ..infrastructure.search_engines import WhooshSearchEngine, TFIDFSearchEngine
+from ..infrastructure.search_engines import SearchHits, WhooshSearchEngine, TFIDFSearchEngine
 from ..infrastructure.data_loader import DataLoader
 from ..config.settings import Settings
 from .query_parser import QueryParser
@@ -23,11 +27,16 @@ class MovieSearchService:
         self.data_loader = DataLoader(settings.database)
         self.movie_repository = MovieRepository(settings.database)
         self.whoosh_engine = WhooshSearchEngine(settings.search, settings.database)
-        self.tfidf_engine = TFIDFSearchEngine(settings.search)
+        self.tfidf_engine = TFIDFSearchEngine(settings.search, settings.database)
         self.query_parser = QueryParser()
         
         self._movies: Optional[List[Movie]] = None
+        self._movies_by_id: Dict[str, Movie] = {}
+        self._dataset_fingerprint: Optional[str] = None
         self._is_initialized = False
+        
+        # Whoosh and TF-IDF are independent; query them side by side
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="search")
     
     def initialize(self) -> bool:
         """Initialize the search service."""
@@ -43,6 +52,10 @@ class MovieSearchService:
             # Load movies
             self.logger.info("Loading movies...")
             self._movies = self.movie_repository.load_movies()
+            # Index by ID; iterate in reverse so the first of any duplicate IDs wins
+            self._movies_by_id = {movie.id: movie for movie in reversed(self._movies)}
+            # Indices saved from another dataset or parser version are rebuilt
+            self._dataset_fingerprint = self.movie_repository.dataset_fingerprint()
             
             # Build or load search indices
             self._initialize_search_engines()
@@ -56,23 +69,44 @@ class MovieSearchService:
             return False
     
     def _initialize_search_engines(self):
-        """Initialize search engines with indices."""
-        import os
+        """Initialize search engines with indices, loading or building both concurrently."""
+        if self.whoosh_engine.writer_procs() > 1:
+            # A Whoosh build would fork; forking while TF-IDF runs on another thread is unsafe
+            self._load_or_build_whoosh()
+            self._load_or_build_tfidf()
+            return
         
-        # Check if Whoosh index exists
+        # Engines only read self._movies and each writes its own state
+        whoosh_future = self._executor.submit(self._load_or_build_whoosh)
+        self._load_or_build_tfidf()
+        whoosh_future.result()
+    
+    def _load_or_build_whoosh(self):
+        """Load the existing Whoosh index, building it if that fails."""
         if os.path.exists(self.settings.database.index_dir):
             try:
-                self.logger.info("Loading existing search indices...")
-                self.whoosh_engine.load_index()
-                self.tfidf_engine.build_index(self._movies)  # TF-IDF is quick to rebuild
+                self.logger.info("Loading existing Whoosh index...")
+                self.whoosh_engine.load_index(self._dataset_fingerprint)
                 return
             except Exception as e:
-                self.logger.warning(f"Failed to load existing indices: {e}")
+                self.logger.warning(f"Failed to load existing Whoosh index: {e}")
+        
+        self.logger.info("Building Whoosh index...")
+        self.whoosh_engine.build_index(self._movies, self._dataset_fingerprint)
+    
+    def _load_or_build_tfidf(self):
+        """Load the saved TF-IDF index, refitting it if that fails."""
+        if os.path.exists(self.settings.database.index_dir):
+            try:
+                self.logger.info("Loading existing TF-IDF index...")
+                self.tfidf_engine.load_index(self._movies, self._dataset_fingerprint)
+                return
+            except Exception:
+                pass  # load_index has logged why; fall back to a rebuild
         
-        # Build new indices
-        self.logger.info("Building search indices...")
-        self.whoosh_engine.build_index(self._movies)
-        self.tfidf_engine.build_index(self._movies)
+        self.logger.info("Building TF-IDF index...")
+        self.tfidf_engine.build_index(self._movies, self._dataset_fingerprint)
+        self.tfidf_engine.save_index()
     
     def search(self, query: str, limit: int = 10) -> SearchResponse:
         """Search for movies using natural language query."""
@@ -92,24 +126,12 @@ class MovieSearchService:
             parsed_query = self.query_parser.parse(query)
             
             # Get results from both search engines
-            whoosh_results = self._search_with_whoosh(parsed_query, limit)
+            whoosh_future = self._executor.submit(self._search_with_whoosh, parsed_query, limit)
             tfidf_results = self._search_with_tfidf(parsed_query, limit)
+            whoosh_results = whoosh_future.result()
             
-            # Combine and rank results
-            combined_results = self._combine_results(
-                whoosh_results, tfidf_results, parsed_query
-            )
-            
-            # Convert to SearchResult objects
-            search_results = self._convert_to_search_results(combined_results[:limit])
-            
-            execution_time = (time.time() - start_time) * 1000  # Convert to milliseconds
-            
-            return SearchResponse(
-                query=query,
-                results=search_results,
-                total_found=len(combined_results),
-                execution_time_ms=execution_time
+            return self._build_response(
+                query, parsed_query, whoosh_results, tfidf_results, limit, start_time
             )
             
         except Exception as e:
@@ -121,99 +143,204 @@ class MovieSearchService:
                 execution_time_ms=0.0
             )
     
-    def _search_with_whoosh(self, query: SearchQuery, limit: int) -> List[Dict[str, Any]]:
+    def search_batch(self, queries: List[str], limit: int = 10) -> List[SearchResponse]:
+        """Search for several queries in one call, returning responses in order.
+        
+        Both engines process the whole batch at once, so per-call overhead
+        (TF-IDF transform and similarity, Whoosh searcher locking) is shared.
+        """
+        start_time = time.time()
+        
+        if not self._is_initialized:
+            if not self.initialize():
+                return [
+                    SearchResponse(query=query, results=[], total_found=0, execution_time_ms=0.0)
+                    for query in queries
+                ]
+        
+        try:
+            parsed_queries = [self.query_parser.parse(query) for query in queries]
+            
+            whoosh_future = self._executor.submit(
+                self._search_batch_with_whoosh, parsed_queries, limit
+            )
+            tfidf_batches = self._search_batch_with_tfidf(parsed_queries, limit)
+            whoosh_batches = whoosh_future.result()
+            
+            return [
+                self._build_response(
+                    query, parsed_query, whoosh_results, tfidf_results, limit, start_time
+                )
+                for query, parsed_query, whoosh_results, tfidf_results in zip(
+                    queries, parsed_queries, whoosh_batches, tfidf_batches
+                )
+            ]
+            
+        except Exception as e:
+            self.logger.error(f"Batch search failed: {e}")
+            return [
+                SearchResponse(query=query, results=[], total_found=0, execution_time_ms=0.0)
+                for query in queries
+            ]
+    
+    def _build_response(
+        self,
+        query: str,
+        parsed_query: SearchQuery,
+        whoosh_results: SearchHits,
+        tfidf_results: SearchHits,
+        limit: int,
+        start_time: float
+    ) -> SearchResponse:
+        """Combine engine results into a SearchResponse."""
+        # Combine and rank results
+        combined_results, total_found = self._combine_results(
+            whoosh_results, tfidf_results, parsed_query, limit
+        )
+        
+        # Convert to SearchResult objects
+        search_results = self._convert_to_search_results(combined_results)
+        
+        execution_time = (time.time() - start_time) * 1000  # Convert to milliseconds
+        
+        return SearchResponse(
+            query=query,
+            results=search_results,
+            total_found=total_found,
+            execution_time_ms=execution_time
+        )
+    
+    def _search_with_whoosh(self, query: SearchQuery, limit: int) -> SearchHits:
         """Search using Whoosh engine."""
         try:
             return self.whoosh_engine.search(query, limit)
         except Exception as e:
             self.logger.error(f"Whoosh search failed: {e}")
-            return []
+            return SearchHits.empty('whoosh')
     
-    def _search_with_tfidf(self, query: SearchQuery, limit: int) -> List[Dict[str, Any]]:
+    def _search_with_tfidf(self, query: SearchQuery, limit: int) -> SearchHits:
         """Search using TF-IDF engine."""
         try:
             return self.tfidf_engine.search(query, limit)
         except Exception as e:
             self.logger.error(f"TF-IDF search failed: {e}")
-            return []
+            return SearchHits.empty('tfidf')
+    
+    def _search_batch_with_whoosh(
+        self, queries: List[SearchQuery], limit: int
+    ) -> List[SearchHits]:
+        """Search a batch of queries using Whoosh engine."""
+        try:
+            return self.whoosh_engine.search_batch(queries, limit)
+        except Exception as e:
+            self.logger.error(f"Whoosh batch search failed: {e}")
+            return [SearchHits.empty('whoosh') for _ in queries]
+    
+    def _search_batch_with_tfidf(
+        self, queries: List[SearchQuery], limit: int
+    ) -> List[SearchHits]:
+        """Search a batch of queries using TF-IDF engine."""
+        try:
+            return self.tfidf_engine.search_batch(queries, limit)
+        except Exception as e:
+            self.logger.error(f"TF-IDF batch search failed: {e}")
+            return [SearchHits.empty('tfidf') for _ in queries]
     
     def _combine_results(
         self, 
-        whoosh_results: List[Dict[str, Any]], 
-        tfidf_results: List[Dict[str, Any]],
-        query: SearchQuery
-    ) -> List[Dict[str, Any]]:
-        """Combine and rank results from different search methods."""
-        combined_scores = {}
+        whoosh_results: SearchHits, 
+        tfidf_results: SearchHits,
+        query: SearchQuery,
+        limit: int
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Combine results from different search methods.
+        
+        Returns the top `limit` results by score and the number of candidates ranked.
+        """
+        if not len(whoosh_results) and not len(tfidf_results):
+            return [], 0
         
-        # Add Whoosh results
-        for result in whoosh_results:
-            movie_id = result['id']
-            combined_scores[movie_id] = combined_scores.get(movie_id, {'whoosh': 0, 'tfidf': 0})
-            combined_scores[movie_id]['whoosh'] = result['score']
+        # Weighted combination of scores
+        movie_ids, weighted_scores = self._fuse_scores(whoosh_results, tfidf_results)
         
-        # Add TF-IDF results
-        for result in tfidf_results:
-            movie_id = result['id']
-            combined_scores[movie_id] = combined_scores.get(movie_id, {'whoosh': 0, 'tfidf': 0})
-            combined_scores[movie_id]['tfidf'] = result['score']
+        # Lowercase the query's entities once, not per candidate; reading them here
+        # also picks up any changes made to the query after it was built
+        genres = [genre.lower() for genre in query.genres]
+        actors = [actor.lower() for actor in query.actors]
+        directors = [director.lower() for director in query.directors]
         
-        # Calculate final scores and prepare results
-        final_results = []
-        for movie_id, scores in combined_scores.items():
+        # Add boosts for exact matches
+        candidates = []
+        for movie_id, combined_score in zip(movie_ids, weighted_scores):
             movie = self._get_movie_by_id(movie_id)
-            if not movie:
-                continue
-            
-            # Weighted combination of scores
-            combined_score = (
-                self.settings.search.whoosh_weight * scores['whoosh'] + 
-                self.settings.search.tfidf_weight * scores['tfidf']
-            )
-            
-            # Add boost for exact matches
-            boost = self._calculate_boost(movie, query)
-            combined_score += boost
-            
-            final_results.append({
+            if movie:
+                boost = self._calculate_boost(movie, query.year_range, genres, actors, directors)
+                candidates.append((combined_score + boost, movie))
+        
+        # Select the best by score (ties keep candidate order, as a stable sort would),
+        # then build result dicts for those only
+        top_candidates = heapq.nlargest(limit, candidates, key=itemgetter(0))
+        top_results = [
+            {
                 'movie': movie,
-                'score': combined_score,
-                'relevance_score': min(combined_score * 100, 100),
+                'score': score,
+                'relevance_score': min(score * 100, 100),
                 'source': 'combined'
-            })
+            }
+            for score, movie in top_candidates
+        ]
+        return top_results, len(candidates)
+    
+    def _fuse_scores(
+        self,
+        whoosh_results: SearchHits,
+        tfidf_results: SearchHits
+    ) -> Tuple[List[str], List[float]]:
+        """Weight and sum engine scores per movie ID, in order of first appearance."""
+        # Hit lists are short, so dict lookups beat array set operations here
+        whoosh_scores = dict(zip(whoosh_results.ids.tolist(), whoosh_results.scores.tolist()))
+        tfidf_scores = dict(zip(tfidf_results.ids.tolist(), tfidf_results.scores.tolist()))
+        
+        movie_ids = list(whoosh_scores)
+        movie_ids.extend(movie_id for movie_id in tfidf_scores if movie_id not in whoosh_scores)
         
-        # Sort by score
-        final_results.sort(key=lambda x: x['score'], reverse=True)
-        return final_results
+        whoosh_weight = self.settings.search.whoosh_weight
+        tfidf_weight = self.settings.search.tfidf_weight
+        return movie_ids, [
+            whoosh_weight * whoosh_scores.get(movie_id, 0.0) +
+            tfidf_weight * tfidf_scores.get(movie_id, 0.0)
+            for movie_id in movie_ids
+        ]
     
-    def _calculate_boost(self, movie: Movie, query: SearchQuery) -> float:
-        """Calculate boost score for exact matches."""
+    def _calculate_boost(
+        self,
+        movie: Movie,
+        year_range: Optional[Tuple[int, int]],
+        genres: List[str],
+        actors: List[str],
+        directors: List[str]
+    ) -> float:
+        """Calculate boost score for exact matches of the query's lowercased entities."""
         boost = 0.0
         
         # Boost for genre matches
-        if query.genres:
-            movie_genres = [g.lower() for g in movie.genres]
-            for genre in query.genres:
-                if genre.lower() in movie_genres:
-                    boost += self.settings.search.genre_boost
+        for genre in genres:
+            if genre in movie.genres_lc:
+                boost += self.settings.search.genre_boost
         
         # Boost for actor matches
-        if query.actors:
-            movie_actors = [a.lower() for a in movie.actors]
-            for actor in query.actors:
-                if any(actor.lower() in movie_actor for movie_actor in movie_actors):
-                    boost += self.settings.search.actor_boost
+        for actor in actors:
+            if actor in movie.actors_lc:
+                boost += self.settings.search.actor_boost
         
         # Boost for director matches
-        if query.directors:
-            movie_directors = [d.lower() for d in movie.directors]
-            for director in query.directors:
-                if any(director.lower() in movie_director for movie_director in movie_directors):
-                    boost += self.settings.search.actor_boost  # Same boost as actors
+        for director in directors:
+            if director in movie.directors_lc:
+                boost += self.settings.search.actor_boost  # Same boost as actors
         
         # Boost for year matches
-        if query.year_range and movie.year:
-            year_start, year_end = query.year_range
+        if year_range and movie.year:
+            year_start, year_end = year_range
             if year_start <= movie.year <= year_end:
                 boost += self.settings.search.year_boost
         
@@ -221,28 +348,25 @@ class MovieSearchService:
     
     def _get_movie_by_id(self, movie_id: str) -> Optional[Movie]:
         """Get movie by ID from loaded movies."""
-        if not self._movies:
-            return None
-        
-        for movie in self._movies:
-            if movie.id == movie_id:
-                return movie
-        return None
+        return self._movies_by_id.get(movie_id)
     
     def _convert_to_search_results(self, combined_results: List[Dict[str, Any]]) -> List[SearchResult]:
         """Convert combined results to SearchResult objects."""
-        search_results = []
-        
-        for result in combined_results:
-            search_result = SearchResult(
+        return [
+            SearchResult(
                 movie=result['movie'],
                 score=result['score'],
                 relevance_score=round(result['relevance_score'], 1),
                 source=result['source']
             )
-            search_results.append(search_result)
-        
-        return search_results
+            for result in combined_results
+        ]
+    
+    def get_fingerprint(self) -> Optional[str]:
+        """Identify the dataset and search settings that responses are computed from."""
+        if self._dataset_fingerprint is None:
+            return None
+        return f"{self._dataset_fingerprint}|{self.settings.search!r}"
     
     def get_movie_count(self) -> int:
         """Get total number of movies."""
@@ -250,6 +374,11 @@ class MovieSearchService:
             self.initialize()
         return len(self._movies) if self._movies else 0
     
+    def close(self):
+        """Release worker threads and open index files."""
+        self._executor.shutdown(wait=True)
+        self.whoosh_engine.close()
+    
     def is_ready(self) -> bool:
         """Check if service is ready to handle requests."""
         return (self._is_initialized and 
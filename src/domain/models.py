@@ -1,11 +1,11 @@
 """Domain models for the movie search engine."""
 
-from dataclasses import dataclass
-from typing import List, Optional, Dict, Any, Tuple
+from dataclasses import dataclass, field
+from typing import List, Optional, Dict, Any, Tuple, FrozenSet
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class Movie:
     """Movie domain model."""
     id: str
@@ -18,16 +18,27 @@ class Movie:
     rating: Optional[float] = None
     popularity: Optional[float] = None
     
-    @property
-    def search_text(self) -> str:
-        """Get searchable text representation."""
-        return " ".join([
+    # Derived from the fields above once, at construction
+    search_text: str = field(init=False, repr=False, compare=False)
+    genres_lc: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    actors_lc: str = field(init=False, repr=False, compare=False)
+    directors_lc: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Searchable text representation indexed by both search engines
+        self.search_text = " ".join([
             self.title,
             self.overview,
             " ".join(self.genres),
             " ".join(self.actors),
             " ".join(self.directors)
         ])
+        
+        # Lowercased copies for case-insensitive matching
+        self.genres_lc = frozenset(g.lower() for g in self.genres)
+        # Names joined by newline so one substring test covers every name
+        self.actors_lc = "\n".join(a.lower() for a in self.actors)
+        self.directors_lc = "\n".join(d.lower() for d in self.directors)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -44,7 +55,7 @@ class Movie:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchQuery:
     """Search query domain model."""
     original_query: str
@@ -68,7 +79,7 @@ class SearchQuery:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchResult:
     """Search result domain model."""
     movie: Movie
@@ -87,7 +98,7 @@ class SearchResult:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchResponse:
     """Search response containing results and metadata."""
     query: str
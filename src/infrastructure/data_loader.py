@@ -4,6 +4,7 @@ import os
 import requests
 import logging
 import gzip
+import shutil
 from typing import Optional
 
 from ..config.settings import DatabaseConfig
@@ -29,19 +30,20 @@ class DataLoader:
 
         try:
             self.logger.info(f"Downloading dataset from {url}...")
-            response = requests.get(url, stream=True)
-            response.raise_for_status()
-
-            # Download compressed file
             compressed_path = os.path.join(self.config.data_dir, "movies.csv.gz")
-            with open(compressed_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            with requests.get(url, stream=True) as response:
+                response.raise_for_status()
+                # Undo any HTTP content encoding only; the file itself stays gzipped
+                response.raw.decode_content = True
+
+                # Download compressed file in 1MB chunks
+                with open(compressed_path, 'wb') as f:
+                    shutil.copyfileobj(response.raw, f, length=1024 * 1024)
 
-            # Decompress and rename
-            with gzip.open(compressed_path, 'rt', encoding='utf-8') as f_in:
-                with open(self.config.movies_path, 'w', encoding='utf-8') as f_out:
-                    f_out.write(f_in.read())
+            # Decompress and rename, streaming in 1MB chunks
+            with gzip.open(compressed_path, 'rb') as f_in:
+                with open(self.config.movies_path, 'wb') as f_out:
+                    shutil.copyfileobj(f_in, f_out, length=1024 * 1024)
 
             # Clean up compressed file
             os.remove(compressed_path)
@@ -1,15 +1,27 @@
 """Repository implementations for data access."""
 
 import os
+import csv
+import sys
 import pandas as pd
 import logging
-from typing import List, Optional, Protocol
+from typing import Dict, List, Optional, Protocol
 from abc import ABC, abstractmethod
 
 from ..domain.models import Movie
 from ..config.settings import DatabaseConfig
 
 
+# Dataset columns used to build Movie objects; the rest are never read
+_MOVIE_COLUMNS = frozenset({
+    'title', 'overview', 'genres', 'actors', 'director', 'year', 'rating', 'popularity'
+})
+
+# Bump whenever parsing can change which rows or values are produced. Movie IDs
+# are row positions, so caches and indices built by another version are stale.
+_PARSER_VERSION = 2
+
+
 class MovieRepositoryInterface(Protocol):
     """Movie repository interface."""
     
@@ -33,6 +45,7 @@ class MovieRepository:
         self.config = config
         self._movies_df: Optional[pd.DataFrame] = None
         self._movies: Optional[List[Movie]] = None
+        self._movies_by_id: Optional[Dict[str, Movie]] = None
         self.logger = logging.getLogger(__name__)
     
     def load_movies(self) -> List[Movie]:
@@ -43,27 +56,16 @@ class MovieRepository:
         if not os.path.exists(self.config.movies_path):
             raise FileNotFoundError(f"Movies dataset not found at {self.config.movies_path}")
         
-        self.logger.info("Loading movies from CSV...")
-        
         try:
-            self._movies_df = pd.read_csv(
-                self.config.movies_path,
-                sep='\t',
-                quoting=3,
-                encoding='utf-8',
-                on_bad_lines='skip',
-                engine='python'
-            )
-            
-            # Clean column names and data
-            self._movies_df.columns = self._movies_df.columns.str.strip('"')
-            
-            for col in self._movies_df.columns:
-                if self._movies_df[col].dtype == 'object':
-                    self._movies_df[col] = self._movies_df[col].astype(str).str.strip('"')
+            self._movies_df = self._load_cached_dataframe()
+            if self._movies_df is None:
+                self._movies_df = self._read_csv()
+                self._save_cached_dataframe(self._movies_df)
             
             # Convert DataFrame to Movie objects
             self._movies = self._convert_dataframe_to_movies(self._movies_df)
+            # Index by ID; iterate in reverse so the first of any duplicate IDs wins
+            self._movies_by_id = {movie.id: movie for movie in reversed(self._movies)}
             
             self.logger.info(f"Loaded {len(self._movies)} movies")
             return self._movies
@@ -72,13 +74,65 @@ class MovieRepository:
             self.logger.error(f"Failed to load movies: {e}")
             raise
     
+    def _read_csv(self) -> pd.DataFrame:
+        """Parse and clean the movies CSV."""
+        self.logger.info("Loading movies from CSV...")
+        df = pd.read_csv(
+            self.config.movies_path,
+            sep='\t',
+            quoting=csv.QUOTE_NONE,
+            encoding='utf-8',
+            on_bad_lines='skip',
+            engine='c',
+            # Everything is parsed from strings later; skip type inference.
+            # No usecols: with it the C parser stops skipping rows with extra fields.
+            dtype=str
+        )
+        
+        # Keep the needed columns, then strip their surrounding quotes only
+        df.columns = df.columns.str.strip('"')
+        df = df[[col for col in df.columns if col in _MOVIE_COLUMNS]]
+        for col in df.columns:
+            df[col] = df[col].str.strip('"')
+        
+        return df
+    
+    def dataset_fingerprint(self) -> str:
+        """Identify the dataset file and parser version that movies come from."""
+        stat = os.stat(self.config.movies_path)
+        return f"parser-v{_PARSER_VERSION}:{stat.st_size}:{stat.st_mtime_ns}"
+    
+    def _load_cached_dataframe(self) -> Optional[pd.DataFrame]:
+        """Load parsed movies saved by a previous run from the same dataset and parser."""
+        cache_path = self.config.movies_cache_path
+        try:
+            df = pd.read_pickle(cache_path)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self.logger.warning(f"Failed to load movies cache: {e}")
+            return None
+        
+        if df.attrs.get('fingerprint') != self.dataset_fingerprint():
+            self.logger.info("Movies cache is stale; reparsing CSV")
+            return None
+        
+        self.logger.info("Loaded movies from cache")
+        return df
+    
+    def _save_cached_dataframe(self, df: pd.DataFrame) -> None:
+        """Save parsed movies so later runs can skip CSV parsing."""
+        try:
+            df.attrs['fingerprint'] = self.dataset_fingerprint()
+            df.to_pickle(self.config.movies_cache_path)
+        except Exception as e:
+            self.logger.warning(f"Failed to save movies cache: {e}")
+    
     def get_movie_by_id(self, movie_id: str) -> Optional[Movie]:
         """Get movie by ID."""
-        movies = self.load_movies()
-        for movie in movies:
-            if movie.id == movie_id:
-                return movie
-        return None
+        if self._movies_by_id is None:
+            self.load_movies()
+        return self._movies_by_id.get(movie_id)
     
     def get_movies_count(self) -> int:
         """Get total number of movies."""
@@ -92,62 +146,65 @@ class MovieRepository:
     
     def _convert_dataframe_to_movies(self, df: pd.DataFrame) -> List[Movie]:
         """Convert pandas DataFrame to list of Movie objects."""
-        movies = []
+        ids = [str(idx) for idx in df.index]
+        titles = self._column_strings(df, 'title')
+        overviews = self._column_strings(df, 'overview')
+        genres = self._column_lists(df, 'genres')
+        actors = self._column_lists(df, 'actors')
+        directors = self._column_strings(df, 'director')
+        years = self._column_ints(df, 'year')
+        ratings = self._column_floats(df, 'rating')
+        popularities = self._column_floats(df, 'popularity')
         
-        for idx, row in df.iterrows():
-            movie = Movie(
-                id=str(idx),
-                title=self._safe_get_string(row, 'title'),
-                overview=self._safe_get_string(row, 'overview'),
-                genres=self._parse_comma_separated(self._safe_get_string(row, 'genres')),
-                actors=self._parse_comma_separated(self._safe_get_string(row, 'actors')),
-                directors=self._parse_directors(self._safe_get_string(row, 'director')),
-                year=self._safe_get_int(row, 'year'),
-                rating=self._safe_get_float(row, 'rating'),
-                popularity=self._safe_get_float(row, 'popularity')
-            )
-            movies.append(movie)
+        # Genres, actors and directors repeat across many movies; share one string per value.
+        # Genres are a small closed set and are interned; people go through a local table.
+        names: Dict[str, str] = {}
+        share_name = names.setdefault
         
-        return movies
-    
-    def _safe_get_string(self, row: pd.Series, column: str, default: str = "") -> str:
-        """Safely get string value from row."""
-        if column not in row:
-            return default
-        value = row[column]
-        if pd.isna(value):
-            return default
-        return str(value).strip()
-    
-    def _safe_get_int(self, row: pd.Series, column: str, default: Optional[int] = None) -> Optional[int]:
-        """Safely get integer value from row."""
-        if column not in row:
-            return default
-        value = row[column]
-        if pd.isna(value):
-            return default
-        try:
-            return int(value)
-        except (ValueError, TypeError):
-            return default
-    
-    def _safe_get_float(self, row: pd.Series, column: str, default: Optional[float] = None) -> Optional[float]:
-        """Safely get float value from row."""
-        if column not in row:
-            return default
-        value = row[column]
-        if pd.isna(value):
-            return default
-        try:
-            return float(value)
-        except (ValueError, TypeError):
-            return default
+        return [
+            Movie(
+                id=movie_id,
+                title=title,
+                overview=overview,
+                genres=[sys.intern(g) for g in genre_list],
+                actors=[share_name(a, a) for a in actor_list],
+                directors=[share_name(d, d) for d in self._parse_directors(director_str)],
+                year=year,
+                rating=rating,
+                popularity=popularity
+            )
+            for movie_id, title, overview, genre_list, actor_list, director_str, year, rating, popularity
+            in zip(ids, titles, overviews, genres, actors, directors, years, ratings, popularities)
+        ]
     
-    def _parse_comma_separated(self, field_str: str) -> List[str]:
-        """Parse comma-separated string field."""
-        if not field_str or field_str.strip() == '':
-            return []
-        return [item.strip() for item in field_str.split(',') if item.strip()]
+    def _column_strings(self, df: pd.DataFrame, column: str, default: str = "") -> List[str]:
+        """Get column as stripped strings, with default for missing values."""
+        if column not in df:
+            return [default] * len(df)
+        return df[column].fillna(default).astype(str).str.strip().tolist()
+    
+    def _column_lists(self, df: pd.DataFrame, column: str) -> List[List[str]]:
+        """Get comma-separated column as lists of stripped, non-empty items."""
+        if column not in df:
+            return [[] for _ in range(len(df))]
+        return [
+            [item for item in map(str.strip, parts) if item]
+            for parts in df[column].fillna('').astype(str).str.split(',').tolist()
+        ]
+    
+    def _column_ints(self, df: pd.DataFrame, column: str) -> List[Optional[int]]:
+        """Get column as integers, with None for missing or invalid values."""
+        if column not in df:
+            return [None] * len(df)
+        values = pd.to_numeric(df[column], errors='coerce')
+        return [None if pd.isna(value) else int(value) for value in values.tolist()]
+    
+    def _column_floats(self, df: pd.DataFrame, column: str) -> List[Optional[float]]:
+        """Get column as floats, with None for missing or invalid values."""
+        if column not in df:
+            return [None] * len(df)
+        values = pd.to_numeric(df[column], errors='coerce')
+        return [None if pd.isna(value) else value for value in values.tolist()]
     
     def _parse_directors(self, director_str: str) -> List[str]:
         """Parse director string (single director or comma-separated)."""
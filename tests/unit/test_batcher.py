@@ -0,0 +1,49 @@
+"""Tests for server-side query batching."""
+
+import time
+
+import pytest
+
+gevent = pytest.importorskip("gevent")
+
+from src.api import batcher as batcher_module
+from src.domain.models import SearchResponse
+
+
+class _RecordingService:
+    """MovieSearchService stand-in that records each search_batch call."""
+
+    def __init__(self):
+        self.batches = []
+
+    def search_batch(self, queries, limit):
+        self.batches.append(list(queries))
+        return [SearchResponse(query, [], 0, 0.0) for query in queries]
+
+
+@pytest.fixture
+def service(monkeypatch):
+    # Greenlets cooperate through gevent's own queue; no monkey-patching is needed here
+    monkeypatch.setattr(batcher_module, "batching_available", lambda: True)
+    return _RecordingService()
+
+
+def test_lone_query_is_not_delayed(service):
+    batcher = batcher_module.QueryBatcher(service, batch_size=16)
+
+    start = time.perf_counter()
+    response = batcher.search("alien", 10)
+
+    assert time.perf_counter() - start < 0.02
+    assert response.query == "alien"
+    assert service.batches == [["alien"]]
+
+
+def test_concurrent_queries_share_a_batch(service):
+    batcher = batcher_module.QueryBatcher(service, batch_size=16)
+
+    greenlets = [gevent.spawn(batcher.search, query, 10) for query in ("a", "b", "c")]
+    gevent.joinall(greenlets, raise_error=True)
+
+    assert [g.value.query for g in greenlets] == ["a", "b", "c"]
+    assert service.batches == [["a", "b", "c"]]
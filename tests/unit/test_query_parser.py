@@ -0,0 +1,50 @@
+"""Tests for the natural language query parser."""
+
+import pytest
+
+from src.core.query_parser import QueryParser
+
+
+class _FailingNLP:
+    """spaCy stand-in that fails the test if NER runs."""
+
+    def __call__(self, text):
+        pytest.fail(f"NER ran on {text!r}")
+
+    def pipe(self, texts, **kwargs):
+        pytest.fail(f"NER ran on {list(texts)!r}")
+
+
+@pytest.fixture
+def parser():
+    parser = QueryParser()
+    parser.nlp = None  # Keep results independent of whether spaCy is installed
+    return parser
+
+
+def test_contraction_keeps_its_stem(parser):
+    assert parser.parse("don't look up").keywords == ["don", "look"]
+
+
+def test_genre_synonyms_are_not_keywords(parser):
+    query = parser.parse("animated musical films")
+
+    assert query.genres == ["animation", "music"]
+    assert query.keywords == []
+
+
+def test_genre_synonyms_match_whole_words(parser):
+    query = parser.parse("movies toward the sea")
+
+    assert "war" not in query.genres
+    assert query.keywords == ["toward", "sea"]
+
+
+def test_lowercase_query_skips_ner(parser):
+    parser.nlp = _FailingNLP()
+
+    query = parser.parse("comedy with tom hanks")
+
+    assert query.actors == []
+    assert query.directors == []
+    assert query.keywords == ["tom", "hanks"]
@@ -0,0 +1,153 @@
+"""Tests for the search response caches."""
+
+import pytest
+
+from src.api import web_app
+from src.config.settings import DatabaseConfig
+from src.core import response_cache as response_cache_module
+from src.core.response_cache import MemoryCache, ResponseCache
+from src.domain.models import Movie, SearchResponse, SearchResult
+
+
+class _Clock:
+    """Stand-in for time.time that only moves when told to."""
+
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(response_cache_module.time, "time", clock)
+    return clock
+
+
+def _make_cache(tmp_path, **kwargs):
+    return ResponseCache(DatabaseConfig(index_dir=str(tmp_path)), **kwargs)
+
+
+def _row_count(cache):
+    return cache._connect().execute("SELECT COUNT(*) FROM resp").fetchone()[0]
+
+
+def test_memory_cache_evicts_least_recently_used():
+    cache = MemoryCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+
+    assert (cache.get("a"), cache.get("b"), cache.get("c")) == (1, None, 3)
+
+
+def test_entries_expire_after_ttl(tmp_path, clock):
+    cache = _make_cache(tmp_path, ttl_seconds=60)
+    cache.put("alien", 10, {"results": [1]})
+
+    clock.now += 60
+    assert cache.get("alien", 10) == {"results": [1]}
+
+    clock.now += 1
+    assert cache.get("alien", 10) is None
+
+
+def test_put_deletes_expired_rows(tmp_path, clock):
+    cache = _make_cache(tmp_path, ttl_seconds=60)
+    cache.put("alien", 10, {"results": [1]})
+
+    clock.now += 61
+    cache.put("ghost", 10, {"results": [2]})
+
+    assert _row_count(cache) == 1
+
+
+def test_put_keeps_newest_max_entries(tmp_path, clock):
+    cache = _make_cache(tmp_path, max_entries=2)
+    for i, query in enumerate(["a", "b", "c"]):
+        clock.now += 1
+        cache.put(query, 10, {"results": [i]})
+
+    assert _row_count(cache) == 2
+    assert cache.get("a", 10) is None
+    assert cache.get("c", 10) == {"results": [2]}
+
+
+def test_bind_clears_responses_from_other_data(tmp_path):
+    cache = _make_cache(tmp_path)
+    cache.bind("v1")
+    cache.put("alien", 10, {"results": [1]})
+
+    cache.bind("v1")
+    assert cache.get("alien", 10) == {"results": [1]}
+
+    cache.bind("v2")
+    assert cache.get("alien", 10) is None
+
+
+class _StubService:
+    """MovieSearchService stand-in returning preset responses and counting searches."""
+
+    def __init__(self, settings):
+        self.searches = 0
+        self.results = []
+        self.execution_time_ms = 1.0
+
+    def initialize(self):
+        return True
+
+    def get_fingerprint(self):
+        return "stub"
+
+    def search(self, query, limit=10):
+        self.searches += 1
+        return SearchResponse(
+            query, list(self.results), len(self.results), self.execution_time_ms
+        )
+
+
+@pytest.fixture
+def client_and_service(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    services = []
+
+    def make_service(settings):
+        services.append(_StubService(settings))
+        return services[0]
+
+    monkeypatch.setattr(web_app, "MovieSearchService", make_service)
+    client = web_app.create_app().test_client()
+    client.get("/api/search?q=warmup")  # Creates the service
+    services[0].searches = 0
+    return client, services[0]
+
+
+def test_empty_responses_are_not_cached(client_and_service):
+    client, service = client_and_service
+
+    client.get("/api/search?q=alien")
+    client.get("/api/search?q=alien")
+    assert service.searches == 2
+
+    movie = Movie(id="1", title="Alien", overview="", genres=[], actors=[], directors=[])
+    service.results = [SearchResult(movie, 1.0, 1.0, "whoosh")]
+    client.get("/api/search?q=alien")
+    client.get("/api/search?q=alien")
+    assert service.searches == 3
+
+
+def test_cache_hits_report_lookup_time(client_and_service):
+    client, service = client_and_service
+    movie = Movie(id="1", title="Alien", overview="", genres=[], actors=[], directors=[])
+    service.results = [SearchResult(movie, 1.0, 1.0, "whoosh")]
+    service.execution_time_ms = 500.0
+
+    first = client.get("/api/search?q=alien").json
+    second = client.get("/api/search?q=alien").json
+
+    assert first["execution_time_ms"] == 500.0
+    assert second["execution_time_ms"] < 500.0
+    assert service.searches == 1
@@ -0,0 +1,180 @@
+"""Tests for search engine helpers."""
+
+import numpy as np
+import pytest
+
+from src.config.settings import DatabaseConfig, SearchConfig, Settings
+from src.core.services import MovieSearchService
+from src.domain.models import Movie, SearchQuery
+from src.infrastructure import search_engines
+
+
+@pytest.mark.skipif(search_engines._small_top_k is None, reason="numba is not installed")
+@pytest.mark.parametrize("k", [0, 1, 2, 8, 32, 128])
+def test_small_top_k_matches_stable_argsort(k):
+    rng = np.random.default_rng(k)
+    for _ in range(200):
+        # Few distinct values so ties are common; zeros are never selected
+        scores = rng.integers(0, 5, size=rng.integers(1, 300)).astype(np.float32) / 4
+        
+        expected = np.argsort(-scores, kind='stable')
+        expected = expected[scores[expected] > 0][:k]
+        
+        np.testing.assert_array_equal(search_engines._small_top_k(scores, k), expected)
+
+
+_WORDS = ["alien", "ghost", "river", "city", "robot", "love", "war", "hero", "space", "night"]
+
+
+def _movies(count=60):
+    rng = np.random.default_rng(0)
+    return [
+        Movie(
+            id=str(i),
+            title=" ".join(rng.choice(_WORDS, size=2)),
+            overview=" ".join(rng.choice(_WORDS, size=8)),
+            genres=[],
+            actors=[],
+            directors=[],
+            year=1980 + i % 40
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def tfidf_engine(tmp_path):
+    engine = search_engines.TFIDFSearchEngine(
+        SearchConfig(), DatabaseConfig(index_dir=str(tmp_path))
+    )
+    engine.build_index(_movies())
+    return engine
+
+
+_QUERIES = [
+    SearchQuery("alien war", "alien war", [], [], [], ["alien", "war"]),
+    SearchQuery(
+        "ghost river", "ghost river", [], [], [], ["ghost", "river"], year_range=(1990, 2005)
+    ),
+    SearchQuery("alien war", "alien war", [], [], [], ["alien", "war"]),
+    SearchQuery("zzz", "zzz", [], [], [], ["zzz"]),
+]
+
+
+def _as_lists(hits):
+    return [(list(h.ids), np.round(h.scores, 6).tolist()) for h in hits]
+
+
+def test_tfidf_batch_matches_single_searches(tfidf_engine):
+    batch = tfidf_engine.search_batch(_QUERIES, 5)
+    single = [tfidf_engine.search(query, 5) for query in _QUERIES]
+
+    assert _as_lists(batch) == _as_lists(single)
+    assert batch[0].ids.size and not batch[3].ids.size
+
+
+def test_tfidf_batch_transforms_uncached_queries_once(tfidf_engine, monkeypatch):
+    calls = []
+    transform = tfidf_engine.vectorizer.transform
+
+    def recording_transform(texts):
+        calls.append(list(texts))
+        return transform(texts)
+
+    monkeypatch.setattr(tfidf_engine.vectorizer, "transform", recording_transform)
+
+    tfidf_engine.search_batch(_QUERIES, 5)
+    tfidf_engine.search_batch(_QUERIES, 5)
+
+    assert calls == [["alien war", "ghost river", "zzz"]]
+
+
+@pytest.mark.skipif(search_engines._score_postings is None, reason="numba is not installed")
+def test_tfidf_sparse_product_fallback_matches_kernel(tfidf_engine, monkeypatch):
+    kernel = _as_lists(tfidf_engine.search_batch(_QUERIES, 5))
+
+    monkeypatch.setattr(search_engines, "_score_postings", None)
+    fallback = _as_lists(tfidf_engine.search_batch(_QUERIES, 5))
+
+    assert fallback == kernel
+
+
+def _is_memory_mapped(array):
+    # scipy wraps the mapped arrays in plain ndarray views
+    while array is not None:
+        if isinstance(array, np.memmap):
+            return True
+        array = array.base
+    return False
+
+
+def _service(tmp_path):
+    settings = Settings(database=DatabaseConfig(index_dir=str(tmp_path)))
+    service = MovieSearchService(settings)
+    service._movies = _movies()
+    return service
+
+
+def test_whoosh_load_without_index_reports_missing_index(tmp_path):
+    (tmp_path / "responses.sqlite").touch()
+    engine = search_engines.WhooshSearchEngine(
+        SearchConfig(), DatabaseConfig(index_dir=str(tmp_path))
+    )
+
+    assert not engine.has_saved_index()
+    with pytest.raises(FileNotFoundError, match="no Whoosh index"):
+        engine.load_index("v1")
+
+
+def test_changed_fingerprint_rebuilds_whoosh_index(tmp_path, monkeypatch):
+    service = _service(tmp_path)
+    builds = []
+    build_index = service.whoosh_engine.build_index
+
+    def recording_build_index(movies, fingerprint=None):
+        builds.append(fingerprint)
+        build_index(movies, fingerprint)
+
+    monkeypatch.setattr(service.whoosh_engine, "build_index", recording_build_index)
+
+    for fingerprint in ("v1", "v1", "v2"):
+        service._dataset_fingerprint = fingerprint
+        service._load_or_build_whoosh()
+
+    assert builds == ["v1", "v2"]
+
+
+def test_tfidf_reload_is_memory_mapped_and_ranks_identically(tfidf_engine, tmp_path):
+    assert not tfidf_engine.has_saved_index()
+    tfidf_engine.save_index()
+    assert tfidf_engine.has_saved_index()
+    reloaded = search_engines.TFIDFSearchEngine(
+        SearchConfig(), DatabaseConfig(index_dir=str(tmp_path))
+    )
+    reloaded.load_index(_movies())
+
+    assert _is_memory_mapped(reloaded.tfidf_matrix.data)
+    assert _as_lists(reloaded.search_batch(_QUERIES, 5)) == _as_lists(
+        tfidf_engine.search_batch(_QUERIES, 5)
+    )
+
+
+def test_tfidf_matrix_with_wrong_row_count_is_revectorized(tfidf_engine, tmp_path):
+    tfidf_engine.save_index()
+    movies = _movies(count=61)
+    reloaded = search_engines.TFIDFSearchEngine(
+        SearchConfig(), DatabaseConfig(index_dir=str(tmp_path))
+    )
+    reloaded.load_index(movies)
+
+    assert reloaded.tfidf_matrix.shape[0] == 61
+    assert not _is_memory_mapped(reloaded.tfidf_matrix.data)
+    # The saved vectorizer is reused rather than refitted
+    assert reloaded.vectorizer.vocabulary_ == tfidf_engine.vectorizer.vocabulary_
+    # The re-vectorized matrix replaces the saved one
+    again = search_engines.TFIDFSearchEngine(
+        SearchConfig(), DatabaseConfig(index_dir=str(tmp_path))
+    )
+    again.load_index(movies)
+    assert _is_memory_mapped(again.tfidf_matrix.data)
+    assert again.tfidf_matrix.shape[0] == 61
@@ -0,0 +1,41 @@
+"""Tests for the movie search service."""
+
+import numpy as np
+import pytest
+
+from src.config.settings import Settings
+from src.core.services import MovieSearchService
+from src.domain.models import Movie, SearchQuery
+from src.infrastructure.search_engines import SearchHits
+
+
+def _service():
+    service = MovieSearchService(Settings())
+    movies = [
+        Movie(id="1", title="Plain", overview="", genres=["Drama"], actors=[], directors=[]),
+        Movie(id="2", title="Match", overview="", genres=["Comedy"], actors=["Tom Hanks"],
+              directors=[]),
+    ]
+    service._movies_by_id = {movie.id: movie for movie in movies}
+    return service
+
+
+def _hits(*ids):
+    return SearchHits(np.array(ids, dtype=object), np.full(len(ids), 0.5), "whoosh")
+
+
+def test_boosts_apply_to_entities_set_after_construction():
+    service = _service()
+    query = SearchQuery.from_string("comedy with Tom Hanks")
+    query.genres = ["Comedy"]
+    query.actors.append("Tom Hanks")
+
+    results, ranked = service._combine_results(
+        _hits("1", "2"), SearchHits.empty("tfidf"), query, limit=2
+    )
+
+    search = service.settings.search
+    boost = search.genre_boost + search.actor_boost
+    assert ranked == 2
+    assert [result["movie"].id for result in results] == ["2", "1"]
+    assert results[0]["score"] - results[1]["score"] == pytest.approx(boost)